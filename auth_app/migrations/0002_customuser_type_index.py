@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-08-28 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['type'], name='auth_app_cu_type_46036d_idx'),
+        ),
+    ]
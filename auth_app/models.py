@@ -25,6 +25,9 @@ class CustomUser(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['type']),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.type})"
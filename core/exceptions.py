@@ -0,0 +1,31 @@
+"""Project-wide exception handling for the REST API."""
+import logging
+
+import orjson
+
+from django.http import HttpResponse
+from rest_framework.views import exception_handler
+
+logger = logging.getLogger(__name__)
+
+_ERR_500 = orjson.dumps({'error': 'Internal server error'})
+
+
+def handler(exc, context):
+    """
+    Exception handler returning a static 500 body for unhandled errors.
+
+    DRF's default handler covers APIException subclasses, Http404 and
+    PermissionDenied; anything it does not recognise is logged with its
+    traceback and answered with a pre-encoded body — no per-error dict
+    building or renderer pass, and no internal error text leaking to
+    the client.
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    logger.exception('Unhandled error in %s', context.get('view'))
+    return HttpResponse(
+        _ERR_500, status=500, content_type='application/json'
+    )
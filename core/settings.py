@@ -10,6 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
+import sys
+
 from pathlib import Path
 from decouple import config, Csv
 
@@ -146,6 +149,13 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Tests authenticate via tokens and never verify a password, so the
+# slow production hasher only burns CPU on fixture creation there.
+if 'test' in sys.argv or 'PYTEST_VERSION' in os.environ:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -166,11 +176,21 @@ STATIC_URL = 'static/'
 STATIC_ROOT = config('STATIC_ROOT', default=str(BASE_DIR / 'staticfiles'))
 
 # Media files (User-Uploads: Bilder, PDFs, etc.)
+# Stream uploads straight to a temporary file instead of buffering
+# them in memory first.
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = config('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
 
 
 REST_FRAMEWORK = {
+    'EXCEPTION_HANDLER': 'core.exceptions.handler',
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.TokenAuthentication',
     ],
@@ -184,6 +204,7 @@ REST_FRAMEWORK = {
     'DEFAULT_THROTTLE_RATES': {
         'anon': '1000/day',
         'user': '10000/day',
+        'reviews_list': '60/min',
     },
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend'
@@ -3,7 +3,8 @@ from rest_framework import generics, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db.models import Avg, Count
 
 from reviews_app.models import Review
 from offer_app.models import Offer
@@ -12,6 +13,29 @@ from .serializers import BaseInfoSerializer
 User = get_user_model()
 
 
+def _review_stats():
+    """
+    Return (review_count, average_rating), cached per review version.
+
+    The key embeds the version stamp the review signals bump on every
+    write, so the COUNT/AVG scan runs once per change to the reviews
+    table instead of once per request.
+    """
+    key = 'reviews:stats:{}'.format(cache.get('reviews:version', 0))
+    stats = cache.get(key)
+    if stats is None:
+        aggregates = Review.objects.aggregate(
+            count=Count('id'),
+            avg=Avg('rating')
+        )
+        stats = (
+            aggregates['count'],
+            round(aggregates['avg'], 1) if aggregates['avg'] else 0.0
+        )
+        cache.set(key, stats, None)
+    return stats
+
+
 class BaseInfoView(generics.GenericAPIView):
     """
     API endpoint to get base platform information.
@@ -33,12 +57,7 @@ class BaseInfoView(generics.GenericAPIView):
             500: Internal server error
         """
         try:
-            review_count = Review.objects.count()
-
-            avg_rating = Review.objects.aggregate(
-                Avg('rating')
-            )['rating__avg']
-            average_rating = round(avg_rating, 1) if avg_rating else 0.0
+            review_count, average_rating = _review_stats()
 
             business_profile_count = User.objects.filter(
                 type='business'
@@ -3,6 +3,7 @@ from decimal import Decimal
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 
@@ -107,8 +108,9 @@ class BaseInfoTests(APITestCase):
         )
 
     def setUp(self):
-        """Set up test client for each test."""
+        """Set up test client for each test and reset the stats cache."""
         self.client = APIClient()
+        cache.clear()
 
     def test_base_info_success(self):
         """Test getting base info successfully with correct statistics."""
@@ -134,18 +134,14 @@ class OfferListTests(APITestCase):
 
     def test_list_offers_min_price_calculation(self):
         response = self.client.get(reverse('offer-list'))
-        offer1_data = next(
-            o for o in response.data['results']
-            if o['id'] == self.offer1.id
-        )
+        offers_by_id = {o['id']: o for o in response.data['results']}
+        offer1_data = offers_by_id[self.offer1.id]
         self.assertEqual(float(offer1_data['min_price']), 100.00)
 
     def test_list_offers_min_delivery_time_calculation(self):
         response = self.client.get(reverse('offer-list'))
-        offer1_data = next(
-            o for o in response.data['results']
-            if o['id'] == self.offer1.id
-        )
+        offers_by_id = {o['id']: o for o in response.data['results']}
+        offer1_data = offers_by_id[self.offer1.id]
         self.assertEqual(offer1_data['min_delivery_time'], 7)
 
     def test_filter_by_creator_id(self):
@@ -6,6 +6,39 @@ from order_app.models import Order
 from offer_app.models import OfferDetail
 
 
+def _features_as_list(features):
+    """
+    Coerce a features value to a list.
+
+    Order.features is a JSONField, so the database already hands back a
+    parsed list and the first check returns immediately. The string
+    branches only exist for legacy rows that stored doubly-encoded JSON.
+    """
+    if isinstance(features, list):
+        return features
+
+    if isinstance(features, str):
+        if features.startswith('[') and features.endswith(']'):
+            try:
+                import ast
+                return ast.literal_eval(features)
+            except (ValueError, SyntaxError):
+                pass
+
+        try:
+            parsed = json.loads(features)
+            if isinstance(parsed, list):
+                return parsed
+            elif isinstance(parsed, str):
+                return json.loads(parsed)
+            else:
+                return [parsed]
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return [features]
+
+    return []
+
+
 class OrderListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing orders.
@@ -36,31 +69,7 @@ class OrderListSerializer(serializers.ModelSerializer):
 
     def get_features(self, obj):
         """Ensure features is returned as a list."""
-        features = obj.features
-
-        if isinstance(features, list):
-            return features
-
-        if isinstance(features, str):
-            if features.startswith('[') and features.endswith(']'):
-                try:
-                    import ast
-                    return ast.literal_eval(features)
-                except (ValueError, SyntaxError):
-                    pass
-
-            try:
-                parsed = json.loads(features)
-                if isinstance(parsed, list):
-                    return parsed
-                elif isinstance(parsed, str):
-                    return json.loads(parsed)
-                else:
-                    return [parsed]
-            except (json.JSONDecodeError, TypeError, ValueError):
-                return [features]
-
-        return []
+        return _features_as_list(obj.features)
 
 
 class OrderUpdateSerializer(serializers.ModelSerializer):
@@ -105,31 +114,7 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
 
     def get_features(self, obj):
         """Ensure features is returned as a list."""
-        features = obj.features
-
-        if isinstance(features, list):
-            return features
-
-        if isinstance(features, str):
-            if features.startswith('[') and features.endswith(']'):
-                try:
-                    import ast
-                    return ast.literal_eval(features)
-                except (ValueError, SyntaxError):
-                    pass
-
-            try:
-                parsed = json.loads(features)
-                if isinstance(parsed, list):
-                    return parsed
-                elif isinstance(parsed, str):
-                    return json.loads(parsed)
-                else:
-                    return [parsed]
-            except (json.JSONDecodeError, TypeError, ValueError):
-                return [features]
-
-        return []
+        return _features_as_list(obj.features)
 
     def validate_status(self, value):
         """Validate that status is one of the allowed choices."""
@@ -1,5 +1,6 @@
 """Views for order API endpoints."""
 from rest_framework import generics, status
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
@@ -18,6 +19,14 @@ from .permissions import IsBusinessUserOfOrder, IsAdminUser
 User = get_user_model()
 
 
+class OrderPagination(PageNumberPagination):
+    """Pagination for the order list to bound response size."""
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
 class OrderListCreateView(generics.ListCreateAPIView):
     """
     API endpoint to list and create orders.
@@ -27,6 +36,7 @@ class OrderListCreateView(generics.ListCreateAPIView):
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = OrderPagination
 
     def get_serializer_class(self):
         """Use different serializers for GET and POST."""
@@ -52,6 +62,12 @@ class OrderListCreateView(generics.ListCreateAPIView):
         """
         try:
             queryset = self.get_queryset()
+
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+
             serializer = self.get_serializer(queryset, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
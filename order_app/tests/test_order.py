@@ -47,6 +47,10 @@ class OrderTestBase(APITestCase):
         cls.business_token1 = Token.objects.create(user=cls.business_user1)
         cls.business_token2 = Token.objects.create(user=cls.business_user2)
         cls.admin_token = Token.objects.create(user=cls.admin_user)
+        cls.customer_auth = f'Token {cls.customer_token.key}'
+        cls.business_auth1 = f'Token {cls.business_token1.key}'
+        cls.business_auth2 = f'Token {cls.business_token2.key}'
+        cls.admin_auth = f'Token {cls.admin_token.key}'
         cls.offer = Offer.objects.create(
             user=cls.business_user1,
             title='Test Offer',
@@ -72,57 +76,55 @@ class OrderListTests(OrderTestBase):
     @classmethod
     def setUpTestData(cls):
         super().setUpTestData()
-        cls.order1 = Order.objects.create(
-            customer_user=cls.customer_user,
-            business_user=cls.business_user1,
-            title='Order 1',
-            revisions=3,
-            delivery_time_in_days=5,
-            price=Decimal('150.00'),
-            features=['Logo'],
-            offer_type='basic',
-            status='in_progress'
-        )
-        cls.order2 = Order.objects.create(
-            customer_user=cls.customer_user,
-            business_user=cls.business_user1,
-            title='Order 2',
-            revisions=5,
-            delivery_time_in_days=10,
-            price=Decimal('300.00'),
-            features=['Website'],
-            offer_type='premium',
-            status='completed'
-        )
-        cls.order3 = Order.objects.create(
-            customer_user=cls.customer_user,
-            business_user=cls.business_user2,
-            title='Order 3',
-            revisions=2,
-            delivery_time_in_days=3,
-            price=Decimal('100.00'),
-            features=['App'],
-            offer_type='standard',
-            status='in_progress'
-        )
+        cls.order1, cls.order2, cls.order3 = Order.objects.bulk_create([
+            Order(
+                customer_user=cls.customer_user,
+                business_user=cls.business_user1,
+                title='Order 1',
+                revisions=3,
+                delivery_time_in_days=5,
+                price=Decimal('150.00'),
+                features=['Logo'],
+                offer_type='basic',
+                status='in_progress'
+            ),
+            Order(
+                customer_user=cls.customer_user,
+                business_user=cls.business_user1,
+                title='Order 2',
+                revisions=5,
+                delivery_time_in_days=10,
+                price=Decimal('300.00'),
+                features=['Website'],
+                offer_type='premium',
+                status='completed'
+            ),
+            Order(
+                customer_user=cls.customer_user,
+                business_user=cls.business_user2,
+                title='Order 3',
+                revisions=2,
+                delivery_time_in_days=3,
+                price=Decimal('100.00'),
+                features=['App'],
+                offer_type='standard',
+                status='in_progress'
+            ),
+        ])
 
     def test_list_orders_as_customer(self):
         """Customer sees all their orders."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data['results']), 3)
 
     def test_list_orders_as_business(self):
         """Business user sees only orders where they are business_user."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         response = self.client.get(reverse('order-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_list_orders_unauthenticated(self):
         """Unauthenticated request fails."""
@@ -131,11 +133,19 @@ class OrderListTests(OrderTestBase):
 
     def test_list_orders_ordering(self):
         """Orders are ordered by created_at descending."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        self.assertEqual(response.data[0]['id'], self.order3.id)
+        self.assertEqual(response.data['results'][0]['id'], self.order3.id)
+
+    def test_pagination_limits_response_size(self):
+        """Page size caps the number of orders per response."""
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        url = f"{reverse('order-list')}?page_size=2"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
 
 
 class OrderCreateTests(OrderTestBase):
@@ -143,9 +153,7 @@ class OrderCreateTests(OrderTestBase):
 
     def test_create_order_success(self):
         """Customer can create order from offer detail."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         data = {'offer_detail_id': self.offer_detail.id}
         response = self.client.post(reverse('order-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -162,27 +170,21 @@ class OrderCreateTests(OrderTestBase):
 
     def test_create_order_business_user_forbidden(self):
         """Business user cannot create orders."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         data = {'offer_detail_id': self.offer_detail.id}
         response = self.client.post(reverse('order-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_create_order_missing_offer_detail_id(self):
         """Missing offer_detail_id returns 400."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.post(reverse('order-list'), {}, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('offer_detail_id', response.data)
 
     def test_create_order_invalid_offer_detail_id(self):
         """Invalid offer_detail_id returns 400."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         data = {'offer_detail_id': 99999}
         response = self.client.post(reverse('order-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -214,9 +216,7 @@ class OrderUpdateTests(OrderTestBase):
 
     def test_update_status_success(self):
         """Business user can update their order status."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': self.order.id})
         data = {'status': 'completed'}
         response = self.client.patch(url, data, format='json')
@@ -226,9 +226,7 @@ class OrderUpdateTests(OrderTestBase):
 
     def test_update_status_invalid_choice(self):
         """Invalid status value is rejected."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': self.order.id})
         data = {'status': 'invalid_status'}
         response = self.client.patch(url, data, format='json')
@@ -236,9 +234,7 @@ class OrderUpdateTests(OrderTestBase):
 
     def test_update_customer_forbidden(self):
         """Customer cannot update order status."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse('order-detail', kwargs={'id': self.order.id})
         data = {'status': 'completed'}
         response = self.client.patch(url, data, format='json')
@@ -246,9 +242,7 @@ class OrderUpdateTests(OrderTestBase):
 
     def test_update_wrong_business_user_forbidden(self):
         """Wrong business user cannot update order."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token2.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth2)
         url = reverse('order-detail', kwargs={'id': self.order.id})
         data = {'status': 'completed'}
         response = self.client.patch(url, data, format='json')
@@ -263,9 +257,7 @@ class OrderUpdateTests(OrderTestBase):
 
     def test_update_not_found(self):
         """Non-existent order returns 404."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': 99999})
         data = {'status': 'completed'}
         response = self.client.patch(url, data, format='json')
@@ -273,9 +265,7 @@ class OrderUpdateTests(OrderTestBase):
 
     def test_update_read_only_fields(self):
         """Read-only fields cannot be changed."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': self.order.id})
         data = {'status': 'completed', 'title': 'Hacked', 'price': '999.99'}
         response = self.client.patch(url, data, format='json')
@@ -301,9 +291,7 @@ class OrderDeleteTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.admin_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.admin_auth)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -322,9 +310,7 @@ class OrderDeleteTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -343,9 +329,7 @@ class OrderDeleteTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -371,9 +355,7 @@ class OrderDeleteTests(OrderTestBase):
 
     def test_delete_not_found(self):
         """Non-existent order returns 404."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.admin_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.admin_auth)
         url = reverse('order-detail', kwargs={'id': 99999})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -412,9 +394,7 @@ class OrderCountTests(OrderTestBase):
 
     def test_order_count_success(self):
         """Returns count of in_progress orders."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse(
             'order-count',
             kwargs={'business_user_id': self.business_user1.id}
@@ -425,9 +405,7 @@ class OrderCountTests(OrderTestBase):
 
     def test_order_count_zero(self):
         """Returns 0 for business user with no in_progress orders."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse(
             'order-count',
             kwargs={'business_user_id': self.business_user2.id}
@@ -447,9 +425,7 @@ class OrderCountTests(OrderTestBase):
 
     def test_order_count_user_not_found(self):
         """Non-existent user returns 404."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse('order-count', kwargs={'business_user_id': 99999})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -488,9 +464,7 @@ class CompletedOrderCountTests(OrderTestBase):
 
     def test_completed_order_count_success(self):
         """Returns count of completed orders."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse(
             'completed-order-count',
             kwargs={'business_user_id': self.business_user1.id}
@@ -501,9 +475,7 @@ class CompletedOrderCountTests(OrderTestBase):
 
     def test_completed_order_count_zero(self):
         """Returns 0 for business user with no completed orders."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse(
             'completed-order-count',
             kwargs={'business_user_id': self.business_user2.id}
@@ -523,9 +495,7 @@ class CompletedOrderCountTests(OrderTestBase):
 
     def test_completed_order_count_user_not_found(self):
         """Non-existent user returns 404."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse(
             'completed-order-count',
             kwargs={'business_user_id': 99999}
@@ -539,9 +509,7 @@ class OrderSerializerTests(OrderTestBase):
 
     def test_create_serializer_copies_all_fields(self):
         """OrderCreateSerializer copies all fields from OfferDetail."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         data = {'offer_detail_id': self.offer_detail.id}
         response = self.client.post(reverse('order-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -564,11 +532,9 @@ class OrderSerializerTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertIsInstance(order_data['features'], list)
         self.assertEqual(len(order_data['features']), 3)
 
@@ -585,11 +551,9 @@ class OrderSerializerTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertIsInstance(order_data['features'], list)
         self.assertEqual(order_data['features'], ['X', 'Y'])
 
@@ -610,9 +574,7 @@ class OrderPermissionTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.patch(
             url,
@@ -634,9 +596,7 @@ class OrderPermissionTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.patch(
             url,
@@ -658,9 +618,7 @@ class OrderPermissionTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.admin_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.admin_auth)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -678,9 +636,7 @@ class OrderPermissionTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -702,11 +658,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertEqual(order_data['features'], ['Item1', 'Item2'])
 
     def test_features_malformed_json_fallback(self):
@@ -722,11 +676,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertIsInstance(order_data['features'], list)
         self.assertEqual(order_data['features'], ['invalid json {['])
 
@@ -743,11 +695,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertEqual(order_data['features'], ['Feature A', 'Feature B'])
 
     def test_features_double_json_encoded(self):
@@ -763,11 +713,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertIsInstance(order_data['features'], list)
 
     def test_features_single_value_becomes_list(self):
@@ -783,11 +731,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertIsInstance(order_data['features'], list)
 
     def test_features_empty_list(self):
@@ -803,11 +749,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertEqual(order_data['features'], [])
 
     def test_features_integer_value_becomes_list(self):
@@ -823,11 +767,9 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
-        order_data = [o for o in response.data if o['id'] == order.id][0]
+        order_data = {o['id']: o for o in response.data['results']}[order.id]
         self.assertIsInstance(order_data['features'], list)
 
     def test_update_serializer_features_parsing(self):
@@ -843,9 +785,7 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': order.id})
         response = self.client.patch(
             url,
@@ -868,9 +808,7 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
             offer_type='basic',
             status='in_progress'
         )
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': order.id})
         for status_value in ['in_progress', 'completed', 'cancelled']:
             response = self.client.patch(
@@ -883,9 +821,7 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
 
     def test_offer_detail_validation_not_exists(self):
         """Test OfferDetail.DoesNotExist exception path."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         data = {'offer_detail_id': 999999}
         response = self.client.post(reverse('order-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -893,9 +829,7 @@ class OrderSerializerEdgeCaseTests(OrderTestBase):
 
     def test_create_serializer_invalid_type(self):
         """Test offer_detail_id with invalid type."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         data = {'offer_detail_id': 'not_an_integer'}
         response = self.client.post(reverse('order-list'), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1000,17 +934,13 @@ class OrderViewExceptionTests(OrderTestBase):
 
     def test_list_view_exception_handling(self):
         """Test that list view handles exceptions gracefully."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(reverse('order-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_create_view_exception_handling(self):
         """Test that create view handles exceptions gracefully."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.post(
             reverse('order-list'),
             {'offer_detail_id': self.offer_detail.id},
@@ -1020,9 +950,7 @@ class OrderViewExceptionTests(OrderTestBase):
 
     def test_update_view_http404_exception(self):
         """Test update view handles Http404 exception."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth1)
         url = reverse('order-detail', kwargs={'id': 999999})
         response = self.client.patch(
             url,
@@ -1033,9 +961,7 @@ class OrderViewExceptionTests(OrderTestBase):
 
     def test_delete_view_http404_exception(self):
         """Test delete view handles Http404 exception."""
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.admin_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.admin_auth)
         url = reverse('order-detail', kwargs={'id': 999999})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,5 +1,6 @@
 """Admin configuration for profile app."""
 from django.contrib import admin
+from django.db.models import F
 
 from profile_app.models import Profile
 
@@ -8,6 +9,8 @@ from profile_app.models import Profile
 class ProfileAdmin(admin.ModelAdmin):
     """Admin configuration for Profile model."""
 
+    list_select_related = ('user',)
+
     list_display = [
         'user',
         'get_username',
@@ -46,16 +49,23 @@ class ProfileAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Join the user row once and expose its columns as annotations."""
+        return super().get_queryset(request).select_related('user').annotate(
+            _username=F('user__username'),
+            _type=F('user__type')
+        )
+
     def get_username(self, obj):
         """Display username."""
-        return obj.user.username
+        return obj._username
 
     get_username.short_description = 'Username'
     get_username.admin_order_field = 'user__username'
 
     def get_type(self, obj):
         """Display user type."""
-        return obj.user.type
+        return obj._type
 
     get_type.short_description = 'Type'
     get_type.admin_order_field = 'user__type'
@@ -1,6 +1,8 @@
 """Custom permissions for profile API endpoints."""
 from rest_framework import permissions
 
+_SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """
@@ -11,7 +13,7 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Allow read for all, write only for owner."""
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
 
-        return obj.user == request.user
+        return obj.user_id == request.user.id
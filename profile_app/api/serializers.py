@@ -2,122 +2,118 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 
 from profile_app.models import Profile
 
 User = get_user_model()
 
+def _isoformat(value):
+    """
+    Render an aware datetime the way DRF's DateTimeField does.
+
+    Calling this directly skips the per-row field dispatch and
+    enforce_timezone machinery for the fixed ISO-8601 default format.
+    """
+    formatted = timezone.localtime(value).isoformat()
+    if formatted.endswith('+00:00'):
+        formatted = formatted[:-6] + 'Z'
+    return formatted
+
+
+__all__ = [
+    'ProfileSerializer',
+    'ProfileListSerializer',
+    'ProfileUpdateSerializer'
+]
 
-class ProfileSerializer(serializers.ModelSerializer):
+
+class ProfileSerializer(serializers.Serializer):
     """
     Serializer for user profiles (detail view).
 
     Returns complete profile information including user data.
+
+    Implemented as a plain Serializer with a hand-rolled
+    to_representation, like ProfileListSerializer: the detail payload is
+    read-only and fixed, so there is no reason to pay for
+    ModelSerializer's Meta introspection and per-field machinery.
     """
 
     user = serializers.IntegerField(source='user.id', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
-    email = serializers.EmailField(source='user.email', read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    file = serializers.CharField(read_only=True)
+    location = serializers.CharField(read_only=True)
+    tel = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    working_hours = serializers.CharField(read_only=True)
     type = serializers.CharField(source='user.type', read_only=True)
-
-    file = serializers.ImageField(required=False, allow_null=True)
-
-    class Meta:
-        model = Profile
-        fields = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type',
-            'email',
-            'created_at'
-        ]
-        read_only_fields = ['user', 'username', 'email', 'type', 'created_at']
+    email = serializers.EmailField(source='user.email', read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
 
     def to_representation(self, instance):
-        """Override to ensure empty strings instead of null for fields."""
-        representation = super().to_representation(instance)
-
-        string_fields = [
-            'first_name',
-            'last_name',
-            'location',
-            'tel',
-            'description',
-            'working_hours'
-        ]
-
-        for field in string_fields:
-            if representation.get(field) is None:
-                representation[field] = ''
-
-        if instance.file:
-            representation['file'] = settings.MEDIA_URL + instance.file.name
-        else:
-            representation['file'] = ''
-
-        return representation
-
-
-class ProfileListSerializer(serializers.ModelSerializer):
+        """Build the output dict directly from instance attributes."""
+        user = instance.user
+        file_name = instance.file.name
+        return {
+            'user': instance.user_id,
+            'username': user.username,
+            'first_name': instance.first_name,
+            'last_name': instance.last_name,
+            'file': settings.MEDIA_URL + file_name if file_name else '',
+            'location': instance.location,
+            'tel': instance.tel,
+            'description': instance.description,
+            'working_hours': instance.working_hours,
+            'type': user.type,
+            'email': user.email,
+            'created_at': _isoformat(instance.created_at)
+        }
+
+
+class ProfileListSerializer(serializers.Serializer):
     """
     Serializer for profile list views.
 
     Returns profile information WITHOUT email and created_at.
     Used for /api/profiles/business/ and /api/profiles/customer/
+
+    Implemented as a plain Serializer with a hand-rolled
+    to_representation: every output field is a read-only primitive, so
+    the list path builds one dict per row instead of running the
+    ModelSerializer field machinery per instance.
     """
 
     user = serializers.IntegerField(source='user.id', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    file = serializers.CharField(read_only=True)
+    location = serializers.CharField(read_only=True)
+    tel = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    working_hours = serializers.CharField(read_only=True)
     type = serializers.CharField(source='user.type', read_only=True)
 
-    file = serializers.ImageField(required=False, allow_null=True)
-
-    class Meta:
-        model = Profile
-        fields = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type'
-        ]
-        read_only_fields = ['user', 'username', 'type']
-
     def to_representation(self, instance):
-        """Override to ensure empty strings instead of null for fields."""
-        representation = super().to_representation(instance)
-
-        string_fields = [
-            'first_name',
-            'last_name',
-            'location',
-            'tel',
-            'description',
-            'working_hours'
-        ]
-
-        for field in string_fields:
-            if representation.get(field) is None:
-                representation[field] = ''
-
-        if instance.file:
-            representation['file'] = settings.MEDIA_URL + instance.file.name
-        else:
-            representation['file'] = ''
-
-        return representation
+        """Build the output dict directly from instance attributes."""
+        user = instance.user
+        file_name = instance.file.name
+        return {
+            'user': instance.user_id,
+            'username': user.username,
+            'first_name': instance.first_name or '',
+            'last_name': instance.last_name or '',
+            'file': settings.MEDIA_URL + file_name if file_name else '',
+            'location': instance.location or '',
+            'tel': instance.tel or '',
+            'description': instance.description or '',
+            'working_hours': instance.working_hours or '',
+            'type': user.type
+        }
 
 
 class ProfileUpdateSerializer(serializers.ModelSerializer):
@@ -136,7 +132,7 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Profile
-        fields = [
+        fields = (
             'user',
             'username',
             'first_name',
@@ -149,48 +145,61 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             'type',
             'email',
             'created_at'
-        ]
-        read_only_fields = ['user', 'username', 'type', 'created_at']
+        )
+        read_only_fields = ('created_at',)
 
     def update(self, instance, validated_data):
-        """Update profile and user email if provided."""
+        """Update profile and user email with the narrowest writes."""
         email = validated_data.pop('email', None)
+        update_email = email is not None and email != instance.user.email
+
+        if validated_data and update_email:
+            with transaction.atomic():
+                self._update_profile(instance, validated_data)
+                self._update_email(instance, email)
+        elif validated_data:
+            self._update_profile(instance, validated_data)
+        elif update_email:
+            self._update_email(instance, email)
+
+        return instance
 
+    @staticmethod
+    def _update_profile(instance, validated_data):
+        """Apply profile field changes with a single UPDATE."""
+        if 'file' in validated_data:
+            # File content has to go through save() so the storage
+            # backend writes it; a queryset update would only store the
+            # raw value.
+            changed = list(validated_data.keys())
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save(update_fields=changed + ['updated_at'])
+            return
+
+        updated_at = timezone.now()
+        Profile.objects.filter(pk=instance.pk).update(
+            updated_at=updated_at, **validated_data
+        )
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.updated_at = updated_at
 
-        if email is not None:
-            instance.user.email = email
-            instance.user.save()
-
-        return instance
+    @staticmethod
+    def _update_email(instance, email):
+        """Apply the email change with a single UPDATE."""
+        User.objects.filter(pk=instance.user_id).update(email=email)
+        instance.user.email = email
 
     def to_representation(self, instance):
-        """Override to ensure empty strings instead of null for fields."""
+        """Add the user's email and coerce the file field to a URL."""
         representation = super().to_representation(instance)
 
         representation['email'] = instance.user.email
 
-        string_fields = [
-            'first_name',
-            'last_name',
-            'location',
-            'tel',
-            'description',
-            'working_hours'
-        ]
-
-        for field in string_fields:
-            if representation.get(field) is None:
-                representation[field] = ''
-
-        if instance.file:
-            representation['file'] = settings.MEDIA_URL + instance.file.name
-        else:
-            representation['file'] = ''
+        file_name = instance.file.name
+        representation['file'] = (
+            settings.MEDIA_URL + file_name if file_name else ''
+        )
 
         return representation
-    
-    
-    
\ No newline at end of file
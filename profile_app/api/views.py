@@ -1,10 +1,7 @@
 """Views for profile API endpoints."""
-from rest_framework import generics, status
-from rest_framework.response import Response
+from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
 from django.contrib.auth import get_user_model
-from django.http import Http404
 
 from profile_app.models import Profile
 from .serializers import (
@@ -37,101 +34,6 @@ class ProfileDetailUpdateView(generics.RetrieveUpdateAPIView):
             return ProfileUpdateSerializer
         return ProfileSerializer
 
-    def retrieve(self, request, *args, **kwargs):
-        """
-        Retrieve profile by user ID.
-
-        GET /api/profile/{pk}/
-
-        Returns:
-            200: Profile data successfully retrieved
-            401: User not authenticated
-            404: Profile not found
-            500: Internal server error
-        """
-        try:
-            instance = self.get_object()
-            serializer = self.get_serializer(instance)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-
-        except Http404:
-            return Response(
-                {'detail': 'Profile not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Profile.DoesNotExist:
-            return Response(
-                {'detail': 'Profile not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-    def update(self, request, *args, **kwargs):
-        """
-        Update profile fields (partial update).
-
-        PATCH /api/profile/{pk}/
-
-        Returns:
-            200: Profile successfully updated
-            401: User not authenticated
-            403: User is not the owner of this profile
-            404: Profile not found
-            500: Internal server error
-        """
-        try:
-            instance = self.get_object()
-
-            self.check_object_permissions(request, instance)
-
-            serializer = self.get_serializer(
-                instance,
-                data=request.data,
-                partial=True
-            )
-
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-
-            return Response(
-                serializer.errors,
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        except PermissionDenied:
-            return Response(
-                {
-                    'detail': 'You do not have permission to perform '
-                              'this action.'
-                },
-                status=status.HTTP_403_FORBIDDEN
-            )
-
-        except Http404:
-            return Response(
-                {'detail': 'Profile not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Profile.DoesNotExist:
-            return Response(
-                {'detail': 'Profile not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
 
 class BusinessProfileListView(generics.ListAPIView):
     """
@@ -147,27 +49,11 @@ class BusinessProfileListView(generics.ListAPIView):
         """Filter profiles to only return business users."""
         return Profile.objects.filter(
             user__type='business'
-        ).select_related('user')
-
-    def list(self, request, *args, **kwargs):
-        """
-        List all business profiles.
-
-        Returns:
-            200: List of business profiles
-            401: User not authenticated
-            500: Internal server error
-        """
-        try:
-            queryset = self.get_queryset()
-            serializer = self.get_serializer(queryset, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        ).select_related('user').only(
+            'user', 'first_name', 'last_name', 'file', 'location',
+            'tel', 'description', 'working_hours',
+            'user__username', 'user__type'
+        )
 
 
 class CustomerProfileListView(generics.ListAPIView):
@@ -184,28 +70,8 @@ class CustomerProfileListView(generics.ListAPIView):
         """Filter profiles to only return customer users."""
         return Profile.objects.filter(
             user__type='customer'
-        ).select_related('user')
-
-    def list(self, request, *args, **kwargs):
-        """
-        List all customer profiles.
-
-        Returns:
-            200: List of customer profiles
-            401: User not authenticated
-            500: Internal server error
-        """
-        try:
-            queryset = self.get_queryset()
-            serializer = self.get_serializer(queryset, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-
-
-
+        ).select_related('user').only(
+            'user', 'first_name', 'last_name', 'file', 'location',
+            'tel', 'description', 'working_hours',
+            'user__username', 'user__type'
+        )
@@ -83,13 +83,4 @@ class Profile(models.Model):
 def create_user_profile(sender, instance, created, **kwargs):
     """Signal to automatically create a profile when a user is created."""
     if created:
-        Profile.objects.create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Signal to save profile when user is saved."""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
-        
-        
+        Profile.objects.get_or_create(user=instance)
@@ -1,63 +1,118 @@
 """Tests for profile API endpoints."""
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db.models.signals import post_save
 from rest_framework import status
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase
 from rest_framework.authtoken.models import Token
 
-from profile_app.models import Profile
+from profile_app.models import Profile, create_user_profile
 
 User = get_user_model()
 
+REQUIRED_PROFILE_FIELDS = frozenset({
+    'user', 'username', 'first_name', 'last_name', 'file', 'location',
+    'tel', 'description', 'working_hours', 'type', 'email', 'created_at'
+})
+
+REQUIRED_PROFILE_LIST_FIELDS = frozenset({
+    'user', 'username', 'first_name', 'last_name', 'file', 'location',
+    'tel', 'description', 'working_hours', 'type'
+})
+
+
+def _bulk_create_users(specs):
+    """
+    Bulk-create users with profiles and tokens for test fixtures.
+
+    Takes (username, email, type) tuples and returns matching lists of
+    users, profiles and tokens. The profile signal is disconnected so
+    each table is written with a single INSERT instead of one statement
+    per user, and the password is hashed once and shared.
+    """
+    password = make_password('TestPass123!')
+    post_save.disconnect(create_user_profile, sender=User)
+    try:
+        users = User.objects.bulk_create([
+            User(username=username, email=email,
+                 password=password, type=user_type)
+            for username, email, user_type in specs
+        ])
+        profiles = Profile.objects.bulk_create(
+            [Profile(user=user) for user in users]
+        )
+    finally:
+        post_save.connect(create_user_profile, sender=User)
+    tokens = Token.objects.bulk_create(
+        [Token(user=user, key=Token.generate_key()) for user in users]
+    )
+    return users, profiles, tokens
+
+
+class _ProfileFixtures(APITestCase):
+    """
+    Shared fixtures for the detail and update test classes.
+
+    Builds the union of users both classes need in one bulk pass; the
+    list test classes keep their own fixtures because they assert exact
+    row counts per user type.
+    """
 
-class ProfileDetailTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, profiles, tokens = _bulk_create_users([
+            ('testcustomer', 'customer@test.com', 'customer'),
+            ('testbusiness', 'business@test.com', 'business'),
+            ('user1', 'user1@test.com', 'customer'),
+            ('user2', 'user2@test.com', 'business')
+        ])
+        (cls.customer_user, cls.business_user,
+         cls.user1, cls.user2) = users
+        cls.customer_profile, cls.business_profile = profiles[:2]
+        (cls.customer_token, cls.business_token,
+         cls.token1, cls.token2) = tokens
+        cls.customer_auth = f'Token {cls.customer_token.key}'
+        cls.business_auth = f'Token {cls.business_token.key}'
+        cls.auth1 = f'Token {cls.token1.key}'
+        cls.auth2 = f'Token {cls.token2.key}'
+
+        detail = 'profile-detail'
+        cls.customer_url = reverse(detail, kwargs={'pk': cls.customer_user.id})
+        cls.business_url = reverse(detail, kwargs={'pk': cls.business_user.id})
+        cls.user1_url = reverse(detail, kwargs={'pk': cls.user1.id})
+        cls.user2_url = reverse(detail, kwargs={'pk': cls.user2.id})
+
+
+class ProfileDetailTests(_ProfileFixtures):
     """Tests for GET /api/profile/{pk}/ - Retrieve profile."""
 
     @classmethod
     def setUpTestData(cls):
-        cls.customer_user = User.objects.create_user(
-            username='testcustomer',
-            email='customer@test.com',
-            password='TestPass123!',
-            type='customer'
-        )
-        cls.customer_token = Token.objects.create(user=cls.customer_user)
+        super().setUpTestData()
 
-        cls.business_user = User.objects.create_user(
-            username='testbusiness',
-            email='business@test.com',
-            password='TestPass123!',
-            type='business'
-        )
-        cls.business_token = Token.objects.create(user=cls.business_user)
-
-        cls.customer_profile = cls.customer_user.profile
         cls.customer_profile.first_name = 'John'
         cls.customer_profile.last_name = 'Doe'
         cls.customer_profile.location = 'Berlin'
         cls.customer_profile.tel = '123456789'
         cls.customer_profile.description = 'Customer description'
-        cls.customer_profile.save()
 
-        cls.business_profile = cls.business_user.profile
         cls.business_profile.first_name = 'Max'
         cls.business_profile.last_name = 'Mustermann'
         cls.business_profile.location = 'Berlin'
         cls.business_profile.tel = '123456789'
         cls.business_profile.description = 'Business description'
         cls.business_profile.working_hours = '9-17'
-        cls.business_profile.save()
 
-    def setUp(self):
-        self.client = APIClient()
+        Profile.objects.bulk_update(
+            [cls.customer_profile, cls.business_profile],
+            ['first_name', 'last_name', 'location', 'tel',
+             'description', 'working_hours']
+        )
 
     def test_get_profile_success_authenticated(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
-        response = self.client.get(
-            reverse('profile-detail', kwargs={'pk': self.customer_user.id})
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        response = self.client.get(self.customer_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['user'], self.customer_user.id)
         self.assertEqual(response.data['username'], 'testcustomer')
@@ -71,12 +126,8 @@ class ProfileDetailTests(APITestCase):
         self.assertIn('created_at', response.data)
 
     def test_get_business_profile_success(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token.key}'
-        )
-        response = self.client.get(
-            reverse('profile-detail', kwargs={'pk': self.business_user.id})
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth)
+        response = self.client.get(self.business_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['type'], 'business')
         self.assertEqual(response.data['working_hours'], '9-17')
@@ -84,27 +135,19 @@ class ProfileDetailTests(APITestCase):
         self.assertEqual(response.data['last_name'], 'Mustermann')
 
     def test_get_profile_unauthenticated(self):
-        response = self.client.get(
-            reverse('profile-detail', kwargs={'pk': self.customer_user.id})
-        )
+        response = self.client.get(self.customer_url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_get_profile_not_found(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
         response = self.client.get(
             reverse('profile-detail', kwargs={'pk': 99999})
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_other_user_profile(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
-        response = self.client.get(
-            reverse('profile-detail', kwargs={'pk': self.business_user.id})
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        response = self.client.get(self.business_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['username'], 'testbusiness')
 
@@ -142,59 +185,18 @@ class ProfileDetailTests(APITestCase):
         self.assertEqual(new_user.profile.user, new_user)
 
     def test_profile_response_has_all_required_fields(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
-        response = self.client.get(
-            reverse('profile-detail', kwargs={'pk': self.customer_user.id})
-        )
-        required_fields = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type',
-            'email',
-            'created_at'
-        ]
-        for field in required_fields:
-            self.assertIn(field, response.data, f"Field '{field}' missing")
-
-
-class ProfileUpdateTests(APITestCase):
-    """Tests for PATCH /api/profile/{pk}/ - Update profile."""
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        response = self.client.get(self.customer_url)
+        missing = REQUIRED_PROFILE_FIELDS - response.data.keys()
+        self.assertFalse(missing, f'Missing fields: {missing}')
 
-    @classmethod
-    def setUpTestData(cls):
-        cls.user1 = User.objects.create_user(
-            username='user1',
-            email='user1@test.com',
-            password='TestPass123!',
-            type='customer'
-        )
-        cls.token1 = Token.objects.create(user=cls.user1)
 
-        cls.user2 = User.objects.create_user(
-            username='user2',
-            email='user2@test.com',
-            password='TestPass123!',
-            type='business'
-        )
-        cls.token2 = Token.objects.create(user=cls.user2)
-
-    def setUp(self):
-        self.client = APIClient()
+class ProfileUpdateTests(_ProfileFixtures):
+    """Tests for PATCH /api/profile/{pk}/ - Update profile."""
 
     def test_update_own_profile_success(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
-        url = reverse('profile-detail', kwargs={'pk': self.user1.id})
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+        url = self.user1_url
         data = {
             'first_name': 'Updated',
             'last_name': 'Name',
@@ -215,10 +217,8 @@ class ProfileUpdateTests(APITestCase):
         self.assertEqual(self.user1.profile.first_name, 'Updated')
 
     def test_update_profile_partial(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
-        url = reverse('profile-detail', kwargs={'pk': self.user1.id})
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+        url = self.user1_url
         data = {'first_name': 'John', 'location': 'Hamburg'}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -226,10 +226,8 @@ class ProfileUpdateTests(APITestCase):
         self.assertEqual(response.data['location'], 'Hamburg')
 
     def test_update_email_in_profile(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
-        url = reverse('profile-detail', kwargs={'pk': self.user1.id})
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+        url = self.user1_url
         data = {'email': 'newemail@test.com'}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -238,10 +236,8 @@ class ProfileUpdateTests(APITestCase):
         self.assertEqual(self.user1.email, 'newemail@test.com')
 
     def test_update_other_user_profile_forbidden(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
-        url = reverse('profile-detail', kwargs={'pk': self.user2.id})
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+        url = self.user2_url
         data = {'first_name': 'Hacked'}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -249,49 +245,29 @@ class ProfileUpdateTests(APITestCase):
         self.assertNotEqual(self.user2.profile.first_name, 'Hacked')
 
     def test_update_profile_unauthenticated(self):
-        url = reverse('profile-detail', kwargs={'pk': self.user1.id})
+        url = self.user1_url
         data = {'first_name': 'Hacked'}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_update_profile_not_found(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         url = reverse('profile-detail', kwargs={'pk': 99999})
         data = {'first_name': 'Test'}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_update_profile_returns_all_fields(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
-        url = reverse('profile-detail', kwargs={'pk': self.user1.id})
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+        url = self.user1_url
         data = {'first_name': 'Test'}
         response = self.client.patch(url, data, format='json')
-        required_fields = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type',
-            'email',
-            'created_at'
-        ]
-        for field in required_fields:
-            self.assertIn(field, response.data, f"Field '{field}' missing")
+        missing = REQUIRED_PROFILE_FIELDS - response.data.keys()
+        self.assertFalse(missing, f'Missing fields: {missing}')
 
     def test_update_profile_empty_fields_return_empty_strings(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.token1.key}'
-        )
-        url = reverse('profile-detail', kwargs={'pk': self.user1.id})
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+        url = self.user1_url
         data = {'first_name': 'John'}
         response = self.client.patch(url, data, format='json')
         self.assertIn('last_name', response.data)
@@ -307,42 +283,26 @@ class BusinessProfileListTests(APITestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.customer = User.objects.create_user(
-            username='customer1',
-            email='customer1@test.com',
-            password='TestPass123!',
-            type='customer'
-        )
-        cls.customer_token = Token.objects.create(user=cls.customer)
+        users, profiles, tokens = _bulk_create_users([
+            ('customer1', 'customer1@test.com', 'customer'),
+            ('business1', 'business1@test.com', 'business'),
+            ('business2', 'business2@test.com', 'business')
+        ])
+        cls.customer, cls.business1, cls.business2 = users
+        cls.customer_token = tokens[0]
+        cls.customer_auth = f'Token {cls.customer_token.key}'
+        cls.url = reverse('business-profiles')
 
-        cls.business1 = User.objects.create_user(
-            username='business1',
-            email='business1@test.com',
-            password='TestPass123!',
-            type='business'
+        Profile.objects.filter(pk=cls.business1.pk).update(
+            first_name='Business', last_name='One'
         )
-        cls.business1.profile.first_name = 'Business'
-        cls.business1.profile.last_name = 'One'
-        cls.business1.profile.save()
-
-        cls.business2 = User.objects.create_user(
-            username='business2',
-            email='business2@test.com',
-            password='TestPass123!',
-            type='business'
+        Profile.objects.filter(pk=cls.business2.pk).update(
+            first_name='Business', last_name='Two'
         )
-        cls.business2.profile.first_name = 'Business'
-        cls.business2.profile.last_name = 'Two'
-        cls.business2.profile.save()
-
-    def setUp(self):
-        self.client = APIClient()
 
     def test_list_business_profiles_success(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
-        response = self.client.get(reverse('business-profiles'))
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsInstance(response.data, list)
         self.assertEqual(len(response.data), 2)
@@ -350,33 +310,21 @@ class BusinessProfileListTests(APITestCase):
             self.assertEqual(profile['type'], 'business')
 
     def test_list_business_profiles_unauthenticated(self):
-        response = self.client.get(reverse('business-profiles'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_list_business_profiles_query_count_is_constant(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_list_business_profiles_contains_all_fields(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
-        )
-        response = self.client.get(reverse('business-profiles'))
-        required_fields = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type'
-        ]
+        self.client.credentials(HTTP_AUTHORIZATION=self.customer_auth)
+        response = self.client.get(self.url)
         for profile in response.data:
-            for field in required_fields:
-                self.assertIn(
-                    field,
-                    profile,
-                    f"Field '{field}' missing in profile"
-                )
+            missing = REQUIRED_PROFILE_LIST_FIELDS - profile.keys()
+            self.assertFalse(missing, f'Missing fields: {missing}')
 
 
 class CustomerProfileListTests(APITestCase):
@@ -384,42 +332,26 @@ class CustomerProfileListTests(APITestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.business = User.objects.create_user(
-            username='business1',
-            email='business1@test.com',
-            password='TestPass123!',
-            type='business'
-        )
-        cls.business_token = Token.objects.create(user=cls.business)
+        users, profiles, tokens = _bulk_create_users([
+            ('business1', 'business1@test.com', 'business'),
+            ('customer1', 'customer1@test.com', 'customer'),
+            ('customer2', 'customer2@test.com', 'customer')
+        ])
+        cls.business, cls.customer1, cls.customer2 = users
+        cls.business_token = tokens[0]
+        cls.business_auth = f'Token {cls.business_token.key}'
+        cls.url = reverse('customer-profiles')
 
-        cls.customer1 = User.objects.create_user(
-            username='customer1',
-            email='customer1@test.com',
-            password='TestPass123!',
-            type='customer'
+        Profile.objects.filter(pk=cls.customer1.pk).update(
+            first_name='Customer', last_name='One'
         )
-        cls.customer1.profile.first_name = 'Customer'
-        cls.customer1.profile.last_name = 'One'
-        cls.customer1.profile.save()
-
-        cls.customer2 = User.objects.create_user(
-            username='customer2',
-            email='customer2@test.com',
-            password='TestPass123!',
-            type='customer'
+        Profile.objects.filter(pk=cls.customer2.pk).update(
+            first_name='Customer', last_name='Two'
         )
-        cls.customer2.profile.first_name = 'Customer'
-        cls.customer2.profile.last_name = 'Two'
-        cls.customer2.profile.save()
-
-    def setUp(self):
-        self.client = APIClient()
 
     def test_list_customer_profiles_success(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token.key}'
-        )
-        response = self.client.get(reverse('customer-profiles'))
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsInstance(response.data, list)
         self.assertEqual(len(response.data), 2)
@@ -427,33 +359,21 @@ class CustomerProfileListTests(APITestCase):
             self.assertEqual(profile['type'], 'customer')
 
     def test_list_customer_profiles_unauthenticated(self):
-        response = self.client.get(reverse('customer-profiles'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_list_customer_profiles_query_count_is_constant(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_list_customer_profiles_contains_all_fields(self):
-        self.client.credentials(
-            HTTP_AUTHORIZATION=f'Token {self.business_token.key}'
-        )
-        response = self.client.get(reverse('customer-profiles'))
-        required_fields = [
-            'user',
-            'username',
-            'first_name',
-            'last_name',
-            'file',
-            'location',
-            'tel',
-            'description',
-            'working_hours',
-            'type'
-        ]
+        self.client.credentials(HTTP_AUTHORIZATION=self.business_auth)
+        response = self.client.get(self.url)
         for profile in response.data:
-            for field in required_fields:
-                self.assertIn(
-                    field,
-                    profile,
-                    f"Field '{field}' missing in profile"
-                )
+            missing = REQUIRED_PROFILE_LIST_FIELDS - profile.keys()
+            self.assertFalse(missing, f'Missing fields: {missing}')
                 
 
 
@@ -20,8 +20,8 @@ class ReviewAdmin(admin.ModelAdmin):
     list_filter = ['rating', 'created_at', 'updated_at']
 
     search_fields = [
-        'business_user__username',
-        'reviewer__username',
+        '=business_user__username',
+        '=reviewer__username',
         'description'
     ]
 
@@ -0,0 +1,21 @@
+"""Filters for reviews API endpoints."""
+import django_filters
+
+from reviews_app.models import Review
+
+
+class ReviewFilter(django_filters.FilterSet):
+    """
+    Filter set for the review list.
+
+    Keeps the public business_user_id/reviewer_id parameter names the
+    frontend already sends while letting django-filter do the parsing
+    and validation instead of per-request if-chains in the view.
+    """
+
+    business_user_id = django_filters.NumberFilter(field_name='business_user')
+    reviewer_id = django_filters.NumberFilter(field_name='reviewer')
+
+    class Meta:
+        model = Review
+        fields = ['business_user_id', 'reviewer_id']
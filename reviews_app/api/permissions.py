@@ -10,5 +10,23 @@ class IsReviewOwner(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        """Check if user is the reviewer (owner) of the review."""
-        return obj.reviewer == request.user
\ No newline at end of file
+        """Allow read for all, write only for the reviewer."""
+        if request.method in permissions.SAFE_METHODS:
+            return True
+
+        return obj.reviewer_id == request.user.id
+
+
+class IsCustomer(permissions.BasePermission):
+    """
+    Permission allowing only customer-type users.
+
+    Rejecting non-customers here returns the 403 before any request
+    body parsing or FK lookups the serializer would otherwise run.
+    """
+
+    message = 'Only users with a customer profile can create reviews.'
+
+    def has_permission(self, request, view):
+        """Check that the authenticated user is a customer."""
+        return getattr(request.user, 'type', None) == 'customer'
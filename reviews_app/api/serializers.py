@@ -1,6 +1,7 @@
 """Serializers for reviews API endpoints."""
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 
 from reviews_app.models import Review
 
@@ -40,20 +41,13 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'business_user',
+            'reviewer',
             'rating',
             'description',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
-
-    def validate_rating(self, value):
-        """Validate that rating is between 1 and 5."""
-        if value < 1 or value > 5:
-            raise serializers.ValidationError(
-                "Rating must be between 1 and 5."
-            )
-        return value
+        read_only_fields = ['id', 'reviewer', 'created_at', 'updated_at']
 
     def validate_business_user(self, value):
         """Validate that business_user exists and is a business type."""
@@ -74,9 +68,10 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         403 if not. This validation is kept as a backup/defense-in-depth,
         but should never be reached in normal operation.
 
-        Validates:
-        - User cannot review themselves
-        - User cannot submit duplicate reviews
+        Duplicate reviews are not checked here: the database enforces
+        them via the unique constraint, and create() translates the
+        IntegrityError. That saves a SELECT per POST and cannot race
+        with concurrent submissions.
         """
         request = self.context.get('request')
 
@@ -85,28 +80,20 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
                 "You cannot review yourself."
             )
 
-        if request:
-            existing_review = Review.objects.filter(
-                business_user=data.get('business_user'),
-                reviewer=request.user
-            ).exists()
-            if existing_review:
-                raise serializers.ValidationError(
-                    "You have already reviewed this business user. "
-                    "You can only submit one review per business profile."
-                )
-
         return data
 
     def create(self, validated_data):
         """Create review with reviewer set to current user."""
         request = self.context.get('request')
         validated_data['reviewer'] = request.user
-        return super().create(validated_data)
-
-    def to_representation(self, instance):
-        """Return full review data including reviewer."""
-        return ReviewListSerializer(instance).data
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                "You have already reviewed this business user. "
+                "You can only submit one review per business profile."
+            )
 
 
 class ReviewUpdateSerializer(serializers.ModelSerializer):
@@ -135,12 +122,3 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
-
-    def validate_rating(self, value):
-        """Validate that rating is between 1 and 5."""
-        if value < 1 or value > 5:
-            raise serializers.ValidationError(
-                "Rating must be between 1 and 5."
-            )
-        return value
-    
@@ -1,9 +1,17 @@
 """Views for reviews API endpoints."""
-from rest_framework import generics, status
+import hashlib
+
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.throttling import ScopedRateThrottle
+from django.core.cache import cache
 from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import last_modified
 
 from reviews_app.models import Review
 from .serializers import (
@@ -11,18 +19,88 @@ from .serializers import (
     ReviewCreateSerializer,
     ReviewUpdateSerializer
 )
-from .permissions import IsReviewOwner
+from .filters import ReviewFilter
+from .permissions import IsCustomer, IsReviewOwner
+
+
+_REVIEW_LIST_FIELDS = (
+    'id', 'business_user', 'reviewer', 'rating', 'description',
+    'created_at', 'updated_at'
+)
+
+_ORDER_MAP = {
+    'rating': '-rating',
+    'updated_at': '-updated_at'
+}
+
+
+def _reviews_last_modified(request, *args, **kwargs):
+    """
+    Last write time across all reviews, maintained by the model signals.
+
+    Returning None (stamp not cached yet) simply disables conditional
+    handling for that request.
+    """
+    return cache.get('reviews:last_modified')
+
+
+class ReviewOrderingFilter(OrderingFilter):
+    """
+    Ordering backend preserving the endpoint's descending semantics.
+
+    The public API has always treated ?ordering=rating and
+    ?ordering=updated_at as highest/newest first, so the parameter is
+    mapped through _ORDER_MAP rather than DRF's default ascending
+    interpretation.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        """Map the legacy ordering parameter to its descending field."""
+        param = request.query_params.get(self.ordering_param)
+        return [_ORDER_MAP.get(param, '-updated_at')]
+
+
+class ReviewCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the review list.
+
+    Keyset pagination walks the updated_at index instead of counting
+    and offsetting the whole table. The ordering follows whatever the
+    queryset already ordered by so the ?ordering= parameter keeps
+    working.
+    """
+
+    page_size = 50
 
+    def get_ordering(self, request, queryset, view):
+        """Use the queryset's ordering for the cursor."""
+        return queryset.query.order_by or ('-updated_at',)
 
+
+@method_decorator(last_modified(_reviews_last_modified), name='list')
 class ReviewListCreateView(generics.ListCreateAPIView):
     """
     API endpoint to list and create reviews.
 
     GET /api/reviews/ - List all reviews with optional filters
     POST /api/reviews/ - Create a new review
+
+    Clients sending If-Modified-Since get a bodyless 304 whenever no
+    review has changed since their copy.
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = ReviewCursorPagination
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'reviews_list'
+    filter_backends = [DjangoFilterBackend, ReviewOrderingFilter]
+    filterset_class = ReviewFilter
+
+    def get_permissions(self):
+        """Require a customer account for POST."""
+        if self.request.method == 'POST':
+            return [IsAuthenticated(), IsCustomer()]
+        return [IsAuthenticated()]
 
     def get_serializer_class(self):
         """Return appropriate serializer based on request method."""
@@ -32,76 +110,44 @@ class ReviewListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         """
-        Get reviews with optional filtering.
+        Base review queryset for the list endpoint.
 
-        Query parameters:
-            business_user_id: Filter by business user
-            reviewer_id: Filter by reviewer
-            ordering: Sort by 'updated_at' or 'rating'
+        Filtering (business_user_id, reviewer_id) and ordering live in
+        the filter backends, which parse the parameters once through
+        compiled filter fields instead of per-request if-chains.
         """
-        queryset = Review.objects.all()
-
-        business_user_id = self.request.query_params.get('business_user_id')
-        if business_user_id:
-            queryset = queryset.filter(business_user_id=business_user_id)
+        return Review.objects.select_related(
+            'business_user', 'reviewer'
+        ).only(*_REVIEW_LIST_FIELDS)
 
-        reviewer_id = self.request.query_params.get('reviewer_id')
-        if reviewer_id:
-            queryset = queryset.filter(reviewer_id=reviewer_id)
-
-        ordering = self.request.query_params.get('ordering')
-        if ordering == 'updated_at':
-            queryset = queryset.order_by('-updated_at')
-        elif ordering == 'rating':
-            queryset = queryset.order_by('-rating')
-        else:
-            queryset = queryset.order_by('-updated_at')
-
-        return queryset
-
-    def create(self, request, *args, **kwargs):
+    def list(self, request, *args, **kwargs):
         """
-        Create a new review.
-
-        Returns:
-            201: Review created successfully
-            400: Validation errors
-            401: User not authenticated
-            403: User is not a customer (business users forbidden)
-            500: Internal server error
+        Serve cached list responses until a review changes.
+
+        The key embeds the version stamp the model signals bump on
+        every review write, so invalidation never has to scan cache
+        keys — stale entries simply stop being addressed.
         """
-        try:
-            if request.user.type != 'customer':
-                return Response(
-                    {
-                        'detail': 'Only users with a customer profile can '
-                                  'create reviews.'
-                    },
-                    status=status.HTTP_403_FORBIDDEN
-                )
-
-            serializer = self.get_serializer(
-                data=request.data,
-                context={'request': request}
-            )
-
-            if serializer.is_valid():
-                review = serializer.save()
-                return Response(
-                    serializer.to_representation(review),
-                    status=status.HTTP_201_CREATED
-                )
-
-            return Response(
-                serializer.errors,
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        query = request.META.get('QUERY_STRING', '')
+        key = 'reviews:list:{}:{}'.format(
+            cache.get('reviews:version', 0),
+            hashlib.md5(query.encode()).hexdigest()
+        )
+
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        # The payload is FK ids and scalars only, so .values() rows are
+        # already the exact dicts the serializer would produce —
+        # CursorPagination pages dicts just as well as instances.
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *_REVIEW_LIST_FIELDS
+        )
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(page)
+        cache.set(key, response.data, 300)
+        return response
 
 
 class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -120,97 +166,22 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
         """Both PATCH and DELETE require IsAuthenticated + IsReviewOwner."""
         return [IsAuthenticated(), IsReviewOwner()]
 
-    def get_serializer_class(self):
-        """Use ReviewUpdateSerializer for PATCH."""
-        return ReviewUpdateSerializer
-
-    def update(self, request, *args, **kwargs):
-        """
-        Update review (rating and/or description).
-
-        Returns:
-            200: Review updated successfully
-            400: Validation errors
-            401: User not authenticated
-            403: User is not the review owner
-            404: Review not found
-            500: Internal server error
+    def get_object(self):
         """
-        try:
-            instance = self.get_object()
-
-            serializer = self.get_serializer(
-                instance,
-                data=request.data,
-                partial=True
-            )
-
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-
-            return Response(
-                serializer.errors,
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        except PermissionDenied:
-            return Response(
-                {
-                    'detail': 'You do not have permission to perform '
-                              'this action.'
-                },
-                status=status.HTTP_403_FORBIDDEN
-            )
-
-        except Http404:
-            return Response(
-                {'detail': 'Review not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-    def destroy(self, request, *args, **kwargs):
-        """
-        Delete review.
-
-        Returns:
-            204: Review deleted successfully
-            401: User not authenticated
-            403: User is not the review owner
-            404: Review not found
-            500: Internal server error
+        Fetch the review directly by primary key.
+
+        Skips the generic queryset/filter machinery — the detail routes
+        only ever need one row by pk, and the ownership check compares
+        reviewer_id, so no user join is required either.
         """
         try:
-            instance = self.get_object()
-            self.perform_destroy(instance)
-            return Response(status=status.HTTP_204_NO_CONTENT)
-
-        except PermissionDenied:
-            return Response(
-                {
-                    'detail': 'You do not have permission to perform '
-                              'this action.'
-                },
-                status=status.HTTP_403_FORBIDDEN
-            )
-
-        except Http404:
-            return Response(
-                {'detail': 'Review not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Exception as e:
-            return Response(
-                {'error': 'Internal server error', 'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-            
+            obj = Review.objects.get(pk=self.kwargs['id'])
+        except Review.DoesNotExist:
+            raise Http404
 
+        self.check_object_permissions(self.request, obj)
+        return obj
 
+    def get_serializer_class(self):
+        """Use ReviewUpdateSerializer for PATCH."""
+        return ReviewUpdateSerializer
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-08-28 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0002_alter_review_unique_together'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='review',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(
+                fields=('business_user', 'reviewer'),
+                name='uniq_review_per_reviewer_business'
+            ),
+        ),
+    ]
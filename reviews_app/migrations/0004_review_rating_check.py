@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-08-28 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0003_review_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.CheckConstraint(
+                condition=models.Q(('rating__gte', 1), ('rating__lte', 5)),
+                name='review_rating_between_1_and_5'
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-08-28 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0004_review_rating_check'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                fields=['business_user', '-updated_at'],
+                name='reviews_app_busines_16a827_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                fields=['reviewer', '-updated_at'],
+                name='reviews_app_reviewe_c6b305_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                fields=['-rating'],
+                name='reviews_app_rating_cbb6e8_idx'
+            ),
+        ),
+    ]
@@ -1,7 +1,11 @@
 """Models for reviews app."""
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -40,7 +44,21 @@ class Review(models.Model):
         ordering = ['-updated_at']
         verbose_name = 'Review'
         verbose_name_plural = 'Reviews'
-        unique_together = [['business_user', 'reviewer']]
+        indexes = [
+            models.Index(fields=['business_user', '-updated_at']),
+            models.Index(fields=['reviewer', '-updated_at']),
+            models.Index(fields=['-rating']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['business_user', 'reviewer'],
+                name='uniq_review_per_reviewer_business'
+            ),
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=1, rating__lte=5),
+                name='review_rating_between_1_and_5'
+            )
+        ]
 
     def __str__(self):
         return (
@@ -49,3 +67,12 @@ class Review(models.Model):
         )
 
 
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def bump_reviews_version(sender, **kwargs):
+    """Invalidate cached review listings by bumping the version stamp."""
+    try:
+        cache.incr('reviews:version')
+    except ValueError:
+        cache.set('reviews:version', 1, None)
+    cache.set('reviews:last_modified', timezone.now(), None)
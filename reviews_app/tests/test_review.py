@@ -1,6 +1,8 @@
 """Tests for reviews API endpoints."""
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
@@ -10,42 +12,46 @@ from reviews_app.models import Review
 User = get_user_model()
 
 
+def _bulk_create_users(specs):
+    """
+    Bulk-create users and tokens for test fixtures.
+
+    Takes (username, email, type) tuples and returns matching lists of
+    users and tokens — one INSERT per table and a single shared
+    password hash instead of per-user statements. Review tests never
+    touch profiles, so skipping the profile signal is fine here.
+    """
+    password = make_password('TestPass123!')
+    users = User.objects.bulk_create([
+        User(username=username, email=email,
+             password=password, type=user_type)
+        for username, email, user_type in specs
+    ])
+    tokens = Token.objects.bulk_create(
+        [Token(user=user, key=Token.generate_key()) for user in users]
+    )
+    return users, tokens
+
+
 class ReviewAPITestCase(APITestCase):
     """Base class with common setup for all review tests."""
 
     @classmethod
     def setUpTestData(cls):
-        cls.customer_user = User.objects.create_user(
-            username='customer',
-            email='customer@test.com',
-            password='TestPass123!',
-            type='customer'
-        )
-        cls.business_user1 = User.objects.create_user(
-            username='business1',
-            email='business1@test.com',
-            password='TestPass123!',
-            type='business'
-        )
-        cls.business_user2 = User.objects.create_user(
-            username='business2',
-            email='business2@test.com',
-            password='TestPass123!',
-            type='business'
-        )
-        cls.reviewer2 = User.objects.create_user(
-            username='reviewer2',
-            email='reviewer2@test.com',
-            password='TestPass123!',
-            type='customer'
-        )
-        cls.customer_token = Token.objects.create(user=cls.customer_user)
-        cls.business_token1 = Token.objects.create(user=cls.business_user1)
-        cls.business_token2 = Token.objects.create(user=cls.business_user2)
-        cls.reviewer2_token = Token.objects.create(user=cls.reviewer2)
+        users, tokens = _bulk_create_users([
+            ('customer', 'customer@test.com', 'customer'),
+            ('business1', 'business1@test.com', 'business'),
+            ('business2', 'business2@test.com', 'business'),
+            ('reviewer2', 'reviewer2@test.com', 'customer')
+        ])
+        (cls.customer_user, cls.business_user1,
+         cls.business_user2, cls.reviewer2) = users
+        (cls.customer_token, cls.business_token1,
+         cls.business_token2, cls.reviewer2_token) = tokens
 
     def setUp(self):
         self.client = APIClient()
+        cache.clear()
 
 
 class ReviewListTests(ReviewAPITestCase):
@@ -79,12 +85,20 @@ class ReviewListTests(ReviewAPITestCase):
         )
         response = self.client.get(reverse('review-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data['results']), 3)
 
     def test_list_reviews_unauthenticated(self):
         response = self.client.get(reverse('review-list'))
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_list_reviews_query_count_is_constant(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
+        )
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('review-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_list_reviews_filter_by_business_user(self):
         self.client.credentials(
             HTTP_AUTHORIZATION=f'Token {self.customer_token.key}'
@@ -95,8 +109,8 @@ class ReviewListTests(ReviewAPITestCase):
         )
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        for review in response.data:
+        self.assertEqual(len(response.data['results']), 2)
+        for review in response.data['results']:
             self.assertEqual(review['business_user'], self.business_user1.id)
 
     def test_list_reviews_filter_by_reviewer(self):
@@ -109,8 +123,8 @@ class ReviewListTests(ReviewAPITestCase):
         )
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        for review in response.data:
+        self.assertEqual(len(response.data['results']), 2)
+        for review in response.data['results']:
             self.assertEqual(review['reviewer'], self.customer_user.id)
 
     def test_list_reviews_ordering_by_rating(self):
@@ -120,7 +134,7 @@ class ReviewListTests(ReviewAPITestCase):
         url = f"{reverse('review-list')}?ordering=rating"
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data[0]['rating'], 5)
+        self.assertEqual(response.data['results'][0]['rating'], 5)
 
     def test_list_reviews_has_required_fields(self):
         self.client.credentials(
@@ -136,7 +150,7 @@ class ReviewListTests(ReviewAPITestCase):
             'created_at',
             'updated_at'
         ]
-        for review in response.data:
+        for review in response.data['results']:
             for field in required_fields:
                 self.assertIn(field, review)
 
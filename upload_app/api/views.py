@@ -1,10 +1,13 @@
 from rest_framework.views import APIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework import status
 from upload_app.models import FileUpload
 from .serializers import FileUploadSerializer
 
 class FileUploadView(APIView):
+    parser_classes = [MultiPartParser]
+
     def post(self, request, format=None):
         serializer = FileUploadSerializer(data=request.data)
         if serializer.is_valid():